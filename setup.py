@@ -13,6 +13,9 @@ setup(
     author_email='your@email.com',
     license = 'MIT',
     packages=find_packages(),
+    extras_require={
+        'async': ['httpx[http2]'],
+    },
     entry_points={
         'console_scripts': [
             'tvnsMockServer = tvnsrtools.tvnsMockServer:main',
@@ -11,32 +11,162 @@ Usage:
 3. Create an instance of the TVNSManager class and use its methods to interact with the tVNS device.
 
 Example Usage:
-    tvns_manager = TVNSManager(tvns_manager_url, log_file_name)
-    tvns_manager.initialize_connection()
-    tvns_manager.start_treatment()
-    tvns_manager.start_stimulation()
-    tvns_manager.pause_stimulation(pause_duration)
-    tvns_manager.stop_stimulation()
-    tvns_manager.stop_treatment()
+    with TVNSManager(tvns_manager_url, log_file_name) as tvns_manager:
+        tvns_manager.initialise_connection()
+        tvns_manager.start_treatment()
+        tvns_manager.start_stimulation()
+        tvns_manager.pause_stimulation(pause_duration)
+        tvns_manager.stop_stimulation()
+        tvns_manager.stop_treatment()
 
 Classes:
 - Logger: Handles logging of events to a log file with timestamps.
 - TVNSManager: Communicates with the tVNS-R Stimulator device via HTTP requests.
+- AsyncTVNSManager: asyncio variant of TVNSManager built on httpx (requires the 'async' extra).
 
 Note: Adjust the 'pause_duration' variable as needed to control the duration of stimulation pauses.
 
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
+import functools
 import time
 from datetime import datetime
 import os
+import queue
+import sys
+import threading
+import weakref
+
+
+# Commands understood by the tVNS Manager; each is posted to the endpoint of the same name.
+# method name -> (endpoint, stimactive afterwards or None if unchanged, log message, docstring)
+_COMMANDS = {
+    'initialise_connection': ('initialise', None, "Initialized connection", "Initializes the connection with the tVNS device."),
+    'start_treatment': ('startTreatment', True, "Started treatment", "Starts the tVNS treatment."),
+    'stop_treatment': ('stopTreatment', False, "Stopped treatment", "Stops the tVNS treatment."),
+    'start_stimulation': ('startStimulation', True, "Started stimulation", "Starts the tVNS stimulation."),
+    'stop_stimulation': ('stopStimulation', False, "Stopped stimulation", "Stops the tVNS stimulation."),
+}
+_ENDPOINTS = tuple(endpoint for endpoint, _, _, _ in _COMMANDS.values())
+_BODIES = {name: name.encode() for name in _ENDPOINTS}
+
+
+def _precise_sleep(duration: float):
+    """
+    Sleeps until `duration` seconds have passed on the monotonic clock.
+    The bulk of the wait is a regular sleep; the last ~2 ms are spent busy-waiting,
+    so the wake-up does not depend on the resolution of the OS scheduler.
+    On Windows the system timer resolution is raised to 1 ms (default ~15 ms)
+    for the duration of the sleep only.
+    """
+    deadline = time.monotonic_ns() + int(duration * 1e9)
+    coarse = duration - 0.002
+    if coarse > 0:
+        if sys.platform == "win32":
+            import ctypes
+            ctypes.windll.winmm.timeBeginPeriod(1)
+            try:
+                time.sleep(coarse)
+            finally:
+                ctypes.windll.winmm.timeEndPeriod(1)
+        else:
+            time.sleep(coarse)
+    while time.monotonic_ns() < deadline:
+        pass
+
+def _ts_ms(t: float = None) -> str:
+    """Returns the given (default: current) local time as 'YYYY-mm-dd HH:MM:SS.mmm'."""
+    if t is None:
+        t = time.time()
+    return f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(t))}.{int((t % 1) * 1000):03d}"
+
+def _ts_hms_ms() -> str:
+    """Returns the current local time as 'HH:MM:SS.mmm'."""
+    t = time.time()
+    return f"{time.strftime('%H:%M:%S', time.localtime(t))}.{int((t % 1) * 1000):03d}"
+
+
+_MIN_PULSE_DURATION = 0
+
+def _pulse_result(logger, duration, success):
+    """Logs a finished pulse and builds the (success, message) tuple returned by pulse()."""
+    if logger:
+        logger.log("Started stimulation (pulsed)")
+    outcome = 'success' if success else 'failed'
+    return success, f"{outcome} pulsedStimulation ({duration}s)::{_ts_hms_ms()} (custom return)"
+
+def _pause_message(pause_duration):
+    """Builds the message returned and logged by pause_stimulation()."""
+    return f"Paused stimulation for {pause_duration} seconds / {pause_duration*1000} milliseconds."
+
+
+def _validate_response(func):
+    """Checks whether the response indicates a successful execution of the command."""
+    @functools.wraps(func)
+    def validate(self, *args, **kwargs):
+        response = func(self, *args, **kwargs)
+        validation = response.startswith('success')
+        if self.logger and not validation:
+            self.logger.log(f"Command failed: {response}")
+        return validation, response
+    return validate
+
+def _validate_response_async(func):
+    """Coroutine variant of _validate_response."""
+    @functools.wraps(func)
+    async def validate(self, *args, **kwargs):
+        response = await func(self, *args, **kwargs)
+        validation = response.startswith('success')
+        if self.logger and not validation:
+            self.logger.log(f"Command failed: {response}")
+        return validation, response
+    return validate
+
+
+def _make_command(name):
+    """Builds the TVNSManager method that sends the single command `name` from _COMMANDS."""
+    endpoint, stim_state, message, doc = _COMMANDS[name]
+    def command(self):
+        result = self._send_request(endpoint)
+        if self.logger:
+            self.logger.log(message)
+        if stim_state is not None:
+            self.stimactive = stim_state
+        return result
+    command.__name__ = name
+    command.__qualname__ = f"TVNSManager.{name}"
+    command.__doc__ = doc
+    return _validate_response(command)
+
+def _make_async_command(name):
+    """Builds the AsyncTVNSManager coroutine method that sends the single command `name` from _COMMANDS."""
+    endpoint, stim_state, message, doc = _COMMANDS[name]
+    async def command(self):
+        result = await self._send_request(endpoint)
+        if self.logger:
+            self.logger.log(message)
+        if stim_state is not None:
+            self.stimactive = stim_state
+        return result
+    command.__name__ = name
+    command.__qualname__ = f"AsyncTVNSManager.{name}"
+    command.__doc__ = doc
+    return _validate_response_async(command)
 
 
 class Logger:
     """
     Logger class for recording events with timestamps to a log file.
 
+    Entries are timestamped when log() is called and handed to a background thread,
+    which writes them to the (kept open) log file, so logging does not block the caller
+    on file I/O. Remaining entries are written on close(), when the Logger is garbage
+    collected, or at interpreter exit.
+    An error raised while writing is kept and re-raised by the next flush() or close().
+
     Args:
         log_file (str): The path to the log file. If the file exists, a timestamp
                        will be appended to the file name to create a new log file.
@@ -44,7 +174,16 @@ class Logger:
     Methods:
         log(message, participant_name=None):
             Logs a message with an optional participant name and timestamp to the log file.
+            Raises ValueError once the logger has been closed.
+
+        flush():
+            Blocks until all pending log entries have been written to the log file.
+
+        close():
+            Writes pending log entries, stops the writer thread and closes the log file.
     """
+    _STOP = object()
+
     def __init__(self, log_file):
         # Check if the log file already exists
         if os.path.exists(log_file):
@@ -53,6 +192,15 @@ class Logger:
             log_file = f"{log_file}_{current_time}.txt"
 
         self.log_file = log_file
+        self._fh = open(self.log_file, "a", buffering=1 << 16)
+        self._q = queue.Queue()
+        self._closed = False
+        self._errors = []
+        # The writer thread and the finalizer only hold the queue, file and error list, not the
+        # Logger itself, so a Logger that is dropped without close() is still collected and shut down
+        self._writer = threading.Thread(target=self._drain, args=(self._q, self._fh, self._errors), daemon=True)
+        self._writer.start()
+        self._finalizer = weakref.finalize(self, self._shutdown, self._q, self._writer, self._fh)
 
     def log(self, message, participant_name=None):
         """
@@ -61,15 +209,78 @@ class Logger:
         Args:
             message (str): The log message to be recorded.
             participant_name (str, optional): The name of the participant, if applicable.
-        """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        log_entry = f"{current_time}"
-        if participant_name:
-            log_entry += f" - Participant: {participant_name}"
-        log_entry += f" - {message}\n"
 
-        with open(self.log_file, "a") as file:
-            file.write(log_entry)
+        Raises:
+            ValueError: If the logger has already been closed.
+        """
+        if self._closed:
+            raise ValueError(f"Cannot log to closed log file {self.log_file}")
+        self._q.put_nowait((time.time(), participant_name, message))
+
+    @staticmethod
+    def _drain(q, fh, errors):
+        """Writes queued entries to the log file; everything queued at once is written in one go."""
+        while True:
+            records = [q.get()]
+            while True:
+                try:
+                    records.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            try:
+                lines = []
+                for record in records:
+                    if record is Logger._STOP:
+                        stop = True
+                        continue
+                    timestamp, participant_name, message = record
+                    log_entry = _ts_ms(timestamp)
+                    if participant_name:
+                        log_entry += f" - Participant: {participant_name}"
+                    lines.append(f"{log_entry} - {message}\n")
+                if lines:
+                    fh.write("".join(lines))
+                    fh.flush()
+            except Exception as e:
+                # Keep the writer alive and hand the error to the next flush()/close()
+                errors.append(e)
+            finally:
+                for _ in records:
+                    q.task_done()
+            if stop:
+                return
+
+    @staticmethod
+    def _shutdown(q, writer, fh):
+        """Stops the writer thread once it has written everything queued, then closes the log file."""
+        q.put(Logger._STOP)
+        writer.join()
+        fh.close()
+
+    def _raise_error(self):
+        """Re-raises an error the writer thread ran into, if any."""
+        if self._errors:
+            error = self._errors[0]
+            self._errors.clear()
+            raise error
+
+    def flush(self):
+        """Blocks until all pending log entries have been written to the log file."""
+        if not self._closed:
+            self._q.join()
+        self._raise_error()
+
+    def close(self):
+        """Writes pending log entries, stops the writer thread and closes the log file."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._finalizer()
+        finally:
+            self._raise_error()
 
 class TVNSManager:
     """
@@ -78,6 +289,9 @@ class TVNSManager:
     Args:
         base_url (str): The base URL of the tVNS Manager.
         log_file (str, optional): The path to the log file for recording events.
+        session (requests.Session, optional): An existing session to send requests through.
+            Managers sharing a session share its connection pool. A shared session
+            is not closed by close().
 
     Methods:
         initialise_connection():
@@ -98,13 +312,43 @@ class TVNSManager:
         pause_stimulation(pause_duration):
             Pauses the tVNS stimulation for a specified duration.
 
+        close():
+            Closes the HTTP session (unless it was passed in) and the log file.
+
         _send_request(endpoint, body=None):
             Sends an HTTP POST request to the tVNS Manager endpoint.
+
+    The manager keeps a single HTTP session open, so consecutive commands reuse
+    the same connection. It can be used as a context manager to close it cleanly.
     """
-    def __init__(self, base_url:str = "http://127.0.0.1:51523/tvnsmanager/", log_file:str = None):
-        self.base_url = base_url
+    _HEADERS = {"Content-Type": "text/plain"}
+
+    def __init__(self, base_url:str = "http://127.0.0.1:51523/tvnsmanager/", log_file:str = None,
+                 session:requests.Session = None):
+        self.base_url = base_url.rstrip('/')
+        self._urls = {name: f"{self.base_url}/{name}" for name in _ENDPOINTS}
         self.logger = Logger(log_file) if log_file else None
         self.stimactive = False
+        self._owns_session = session is None
+        if self._owns_session:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self._session = session
+
+    def close(self):
+        """Closes the HTTP session (unless it was passed in) and the log file."""
+        if self._owns_session:
+            self._session.close()
+        if self.logger:
+            self.logger.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _send_request(self, endpoint, body=None):
         """
@@ -112,76 +356,26 @@ class TVNSManager:
 
         Args:
             endpoint (str): The endpoint to which the request is sent.
-            body (str, optional): The request body.
+            body (str, optional): The request body. Defaults to the command named by the endpoint.
 
         Returns:
             str: The response text from the HTTP request.
         """
-        url = f"{self.base_url}/{endpoint}"
-        headers = {"Content-Type": "text/plain"}
-        response = requests.post(url, data=body, headers=headers)
+        url = self._urls.get(endpoint) or f"{self.base_url}/{endpoint}"
+        if body is None:
+            body = _BODIES.get(endpoint)
+        response = self._session.post(url, data=body, headers=self._HEADERS)
 
         if response.status_code == 200:
             return response.text
         else:
             return f"HTTP request failed with status code: {response.status_code}"
     
-    def _validate_response(func):
-        """Checks whether the response indicates a successful execution of the command."""
-        def validate(self, *args, **kwargs):
-            response =  func(self, *args, **kwargs)
-            validation = 'success' in response 
-            if self.logger and not validation:
-                self.logger.log(f"Command failed: {response}")
-            return validation, response 
-        return validate 
-
-    @_validate_response
-    def initialise_connection(self):
-        """Initializes the connection with the tVNS device."""
-        result = self._send_request("initialise", "initialise")
-        if self.logger:
-            self.logger.log("Initialized connection")
-        self._validate_response
-        return result
-    
-    @_validate_response
-    def start_treatment(self):
-        """Starts the tVNS treatment."""
-        result = self._send_request("startTreatment", "startTreatment")
-        if self.logger:
-            self.logger.log("Started treatment")
-        self.stimactive = True
-        return result
-    
-    @_validate_response
-    def stop_treatment(self):
-        """Stops the tVNS treatment."""
-        result = self._send_request("stopTreatment", "stopTreatment")
-        if self.logger:
-            self.logger.log("Stopped treatment")
-        self.stimactive = False
-        return result
-
-    @_validate_response
-    def start_stimulation(self):
-        """Starts the tVNS stimulation."""
-        result = self._send_request("startStimulation", "startStimulation")
-        if self.logger:
-            self.logger.log("Started stimulation")
-        self.stimactive = True
-
-        return result
-
-    @_validate_response
-    def stop_stimulation(self):
-        """Stops the tVNS stimulation."""
-        result = self._send_request("stopStimulation", "stopStimulation")
-        if self.logger:
-            self.logger.log("Stopped stimulation")
-        self.stimactive = False
-
-        return result
+    initialise_connection = _make_command('initialise_connection')
+    start_treatment = _make_command('start_treatment')
+    stop_treatment = _make_command('stop_treatment')
+    start_stimulation = _make_command('start_stimulation')
+    stop_stimulation = _make_command('stop_stimulation')
 
     @_validate_response    
     def pause_stimulation(self, pause_duration):
@@ -194,7 +388,7 @@ class TVNSManager:
         Returns:
             str: A message indicating the pause duration.
         """
-        result = f"Paused stimulation for {pause_duration} seconds / {pause_duration*1000} milliseconds."
+        result = _pause_message(pause_duration)
         if self.logger:
             self.logger.log(result)
         time.sleep(pause_duration)
@@ -211,28 +405,136 @@ class TVNSManager:
         Send a stimulation pulse for a specified duration.
         Due to timing uncertainties and bluetooth delay, it is not highly precise.
         """
-        MIN_DURATION = 0
-        if duration < MIN_DURATION:
-            return False, f"Requested Pulse too short. Min duration {MIN_DURATION}s"
+        if duration < _MIN_PULSE_DURATION:
+            return False, f"Requested Pulse too short. Min duration {_MIN_PULSE_DURATION}s"
         if not self.stimactive:
-            start,_ = self.start_stimulation()
-            time.sleep(duration)
+            start, _ = self.start_stimulation()
+            _precise_sleep(duration)
             stop, _ = self.stop_stimulation()
             success = start and stop
-        elif self.stimactive:
-            stop, _  = self.stop_stimulation()
+        else:
+            # Stop the active stimulation first, so every pulse has a defined onset
+            stop, _ = self.stop_stimulation()
             start, _ = self.start_stimulation()
-            time.sleep(duration)
+            _precise_sleep(duration)
             stop2, _ = self.stop_stimulation()
-            
             success = stop and start and stop2
+        return _pulse_result(self.logger, duration, success)
+        
+class AsyncTVNSManager:
+    """
+    Asynchronous counterpart of TVNSManager, built on httpx.AsyncClient.
+
+    All command methods are coroutines and return the same (success, response)
+    tuples as TVNSManager. The client keeps its connections alive between commands,
+    and pulse() waits with asyncio.sleep, so other tasks (e.g. logging or stimulus
+    presentation) can run while the pulse timer is pending.
+
+    Requires httpx with HTTP/2 support: pip install "tvnsrtools[async]"
+
+    Args:
+        base_url (str): The base URL of the tVNS Manager.
+        log_file (str, optional): The path to the log file for recording events.
+
+    Example Usage:
+        async with AsyncTVNSManager(tvns_manager_url) as tvns_manager:
+            await tvns_manager.initialise_connection()
+            await tvns_manager.pulse(0.1)
+    """
+    _HEADERS = {"Content-Type": "text/plain"}
+
+    def __init__(self, base_url:str = "http://127.0.0.1:51523/tvnsmanager/", log_file:str = None):
+        import httpx
+
+        self.base_url = base_url
+        self.logger = Logger(log_file) if log_file else None
+        self.stimactive = False
+        self._client = httpx.AsyncClient(base_url=base_url, http2=True,
+                                         limits=httpx.Limits(max_keepalive_connections=4),
+                                         timeout=5.0)
+
+    async def close(self):
+        """Closes the HTTP client and the log file."""
+        await self._client.aclose()
         if self.logger:
-            self.logger.log("Started stimulation (pulsed)")
-        if success:
-            return success, f"success pulsedStimulation ({duration}s)::{datetime.now().strftime('%H:%M:%S.%f')[:-3]} (custom return)"
+            self.logger.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _send_request(self, endpoint, body=None):
+        """
+        Sends an HTTP POST request to the tVNS Manager endpoint.
+
+        Args:
+            endpoint (str): The endpoint to which the request is sent.
+            body (str, optional): The request body. Defaults to the command named by the endpoint.
+
+        Returns:
+            str: The response text from the HTTP request.
+        """
+        if body is None:
+            body = _BODIES.get(endpoint)
+        response = await self._client.post(endpoint, content=body, headers=self._HEADERS)
+
+        if response.status_code == 200:
+            return response.text
         else:
-            return success, f"failed pulsedStimulation ({duration}s)::{datetime.now().strftime('%H:%M:%S.%f')[:-3]} (custom return)"
-        
+            return f"HTTP request failed with status code: {response.status_code}"
+
+    initialise_connection = _make_async_command('initialise_connection')
+    start_treatment = _make_async_command('start_treatment')
+    stop_treatment = _make_async_command('stop_treatment')
+    start_stimulation = _make_async_command('start_stimulation')
+    stop_stimulation = _make_async_command('stop_stimulation')
+
+    @_validate_response_async
+    async def pause_stimulation(self, pause_duration):
+        """
+        Maintains current stimulation state for a specified duration.
+
+        Args:
+            pause_duration (float): The duration (in seconds) to pause the stimulation.
+
+        Returns:
+            str: A message indicating the pause duration.
+        """
+        result = _pause_message(pause_duration)
+        if self.logger:
+            self.logger.log(result)
+        await asyncio.sleep(pause_duration)
+        return result
+
+    async def soft_start(self):
+        """ Starts a treatment, but stops the stimulation pulse, as normally the entire stimulation program is started. """
+        await self.start_treatment()
+        await asyncio.sleep(0.2)
+        await self.stop_stimulation()
+
+    async def pulse(self, duration):
+        """
+        Send a stimulation pulse for a specified duration.
+        Due to timing uncertainties and bluetooth delay, it is not highly precise.
+        """
+        if duration < _MIN_PULSE_DURATION:
+            return False, f"Requested Pulse too short. Min duration {_MIN_PULSE_DURATION}s"
+        if not self.stimactive:
+            start, _ = await self.start_stimulation()
+            await asyncio.sleep(duration)
+            stop, _ = await self.stop_stimulation()
+            success = start and stop
+        else:
+            # Stop the active stimulation first, so every pulse has a defined onset
+            stop, _ = await self.stop_stimulation()
+            start, _ = await self.start_stimulation()
+            await asyncio.sleep(duration)
+            stop2, _ = await self.stop_stimulation()
+            success = stop and start and stop2
+        return _pulse_result(self.logger, duration, success)
+
 def test():
     # Replace with the participant's name (if applicable) and log file name
     log_file_name    = "tvnslog_test"
@@ -270,6 +572,7 @@ def test():
     tvns_manager.stop_stimulation()
     time.sleep(2)
     print(tvns_manager.stop_treatment())
+    tvns_manager.close()
     
 if __name__ == "__main__":
     test()
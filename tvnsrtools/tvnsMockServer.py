@@ -33,61 +33,87 @@ Example:
 """
 
 import http.server
-import socketserver
 from http import HTTPStatus
 import random
 from datetime import datetime
-import argparse
 
 
 TIMEFORMAT = '%H:%M:%S.%f'
-class TVNSRequestHandler(http.server.SimpleHTTPRequestHandler):
+class TVNSRequestHandler(http.server.BaseHTTPRequestHandler):
+    # command -> (success message, failure message); commands without a failure message never fail
+    _CMDS = {
+        b'initialise': ('The tVNS-R device has been initialized', None),
+        b'startTreatment': ('Treatment started', 'Treatment not started'),
+        b'stopTreatment': ('Treatment stopped', 'Treatment not stopped'),
+        b'startStimulation': ('Stimulation started', 'Stimulation not started'),
+        b'stopStimulation': ('Stimulation stopped', 'Stimulation not stopped'),
+    }
+
+    # Keep connections alive between commands, as the interface reuses a single session;
+    # idle connections are dropped after `timeout` seconds
+    protocol_version = 'HTTP/1.1'
+    timeout = 5
+    # Send small responses immediately instead of waiting for Nagle's algorithm to coalesce them
+    disable_nagle_algorithm = True
+    # Buffer the response so status line, headers and body go out in a single write
+    wbufsize = -1
+
     def __init__(self, *args, **kwargs):
         self.failure_probability = kwargs.pop('failure_probability', 0.0)
+        self._never_fail = self.failure_probability <= 0.0
         super().__init__(*args, **kwargs)
         
     def do_POST(self):
-        content_length = int(self.headers['Content-Length'])
-        post_data = self.rfile.read(content_length).decode('utf-8')
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            content_length = -1
+        # A malformed or negative Content-Length leaves the body unread and ends up in the 400 path below
+        post_data = self.rfile.read(content_length) if content_length >= 0 else None
 
         def send_formatted_response(response_message, success=True):
-            self.send_response(HTTPStatus.OK)
-            self.send_header('Content-type', 'text/plain')
-            self.end_headers()
             timestamp = datetime.now().strftime(TIMEFORMAT)[:-3]
             outcome = 'success' if success else 'failed'
-            self.wfile.write(f'{outcome}: {response_message}::{timestamp} (mocked output) \n'.encode('utf-8'))
-
-        if post_data == 'initialise':
-            send_formatted_response('The tVNS-R device has been initialized')
-        elif post_data == 'startTreatment':
-            if random.random() < self.failure_probability:
-                send_formatted_response('Treatment not started', success=False)
-            else:
-                send_formatted_response('Treatment started')
-        elif post_data == 'stopTreatment':
-            if random.random() < self.failure_probability:
-                send_formatted_response('Treatment not stopped', success=False)
-            else:
-                send_formatted_response('Treatment stopped')
-        elif post_data == 'startStimulation':
-            if random.random() < self.failure_probability:
-                send_formatted_response('Stimulation not started', success=False)
-            else:
-                send_formatted_response('Stimulation started')
-        elif post_data == 'stopStimulation':
-            if random.random() < self.failure_probability:
-                send_formatted_response('Stimulation not stopped', success=False)
-            else:
-                send_formatted_response('Stimulation stopped')
-        else:
-            self.send_response(HTTPStatus.BAD_REQUEST)
-            self.send_header('Content-type', 'text/plain')
-            self.end_headers()
+            self._send_text(HTTPStatus.OK, f'{outcome}: {response_message}::{timestamp} (mocked output) \n')
+
+        entry = self._CMDS.get(post_data)
+        if entry is None:
             timestamp = datetime.now().strftime(TIMEFORMAT)[:-3]
-            self.wfile.write(f'illegal command: The command was not recognized::{timestamp}\n'.encode('utf-8'))
+            # The body may not have been read completely (e.g. chunked without Content-Length), so drop the connection
+            self._send_text(HTTPStatus.BAD_REQUEST, f'illegal command: The command was not recognized::{timestamp}\n',
+                            close_connection=True)
+            return
+
+        success_message, failure_message = entry
+        if failure_message is not None and not self._never_fail and random.random() < self.failure_probability:
+            send_formatted_response(failure_message, success=False)
+        else:
+            send_formatted_response(success_message)
+
+    def log_message(self, format, *args):
+        """Suppresses the per-request access log on stderr."""
+
+    def _send_text(self, status, text, close_connection=False):
+        """Sends a complete plain text response; it is written to the socket in one piece when the buffer is flushed."""
+        body = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-type', 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        if close_connection:
+            # Also sets self.close_connection
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+class TVNSMockHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server with a larger listen backlog for bursts of test clients."""
+    request_queue_size = 128
+    # Connection threads do not keep the process alive on shutdown
+    daemon_threads = True
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Simulate a tVNS-R HTTP server with specified failure probability.")
     parser.add_argument("-p", "--port", type=int, default=51523, help="Port for the HTTP server")
     parser.add_argument("-f", "--failure-probability", type=float, default=0.0, help="Failure probability for tVNS-R commands (0.0 to 1.0)")
@@ -95,9 +121,9 @@ def main():
     port = args.port
     fail = args.failure_probability
 
-    with socketserver.TCPServer(('', port),
-                               lambda *args, **kwargs: TVNSRequestHandler(*args, **kwargs, failure_probability = fail)
-                              ) as httpd:
+    with TVNSMockHTTPServer(('', port),
+                            lambda *args, **kwargs: TVNSRequestHandler(*args, **kwargs, failure_probability = fail)
+                           ) as httpd:
         print('Initializing tVNS-R Mock Server...')
         print(f'Serving on port {port} with {fail * 100}% failure probability...')
         httpd.serve_forever()